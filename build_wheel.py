@@ -5,18 +5,29 @@ Build script for IRSSG wheel package
 
 import os
 import sys
+import shlex
 import subprocess
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-def run_command(cmd, cwd=None):
-    """Run a command and return the result"""
+def run_command(cmd, cwd=None, capture=False):
+    """Run a command and return the result
+    
+    Output is streamed straight to the terminal unless ``capture`` is set,
+    in which case it is collected and only printed if the command fails.
+    """
     print(f"Running: {cmd}")
-    result = subprocess.run(cmd, shell=True, cwd=cwd, capture_output=True, text=True)
+    sys.stdout.flush()
+    if capture:
+        result = subprocess.run(shlex.split(cmd), cwd=cwd, capture_output=True, text=True)
+    else:
+        result = subprocess.run(shlex.split(cmd), cwd=cwd)
     if result.returncode != 0:
         print(f"Error running command: {cmd}")
-        print(f"stdout: {result.stdout}")
-        print(f"stderr: {result.stderr}")
+        if capture:
+            print(f"stdout: {result.stdout}")
+            print(f"stderr: {result.stderr}")
         return False
     print(f"Success: {cmd}")
     return True
@@ -32,9 +43,10 @@ def main():
     
     # Clean previous builds
     print("Cleaning previous builds...")
-    for path in ["build", "dist", "*.egg-info"]:
-        if Path(path).exists():
-            shutil.rmtree(path)
+    # Path() does not expand wildcards, so egg-info directories are globbed
+    targets = [Path("build"), Path("dist"), *Path(".").glob("*.egg-info")]
+    with ThreadPoolExecutor(max_workers=len(targets)) as executor:
+        list(executor.map(lambda path: shutil.rmtree(path, ignore_errors=True), targets))
     
     # Install build dependencies
     print("Installing build dependencies...")
@@ -50,8 +62,10 @@ def main():
     print("\nBuilt packages:")
     dist_dir = Path("dist")
     if dist_dir.exists():
-        for file in dist_dir.glob("*"):
-            print(f"  {file}")
+        with os.scandir(dist_dir) as entries:
+            names = sorted(entry.name for entry in entries)
+        for name in names:
+            print(f"  {os.path.join(dist_dir, name)}")
     
     print("\nBuild completed successfully!")
     return 0
@@ -19,28 +19,35 @@ def _setup_data_path():
     package_dir = os.path.dirname(os.path.abspath(__file__))
     
     # Look for data directory in various possible locations
-    possible_paths = [
+    possible_paths = (
         os.path.join(package_dir, 'data', 'kLittleGroups'),
         os.path.join(package_dir, '..', 'data', 'kLittleGroups'),
         os.path.join(package_dir, '..', '..', 'data', 'kLittleGroups'),
-    ]
+    )
     
-    # Set the environment variable to the first existing path
-    for path in possible_paths:
-        if os.path.exists(path):
-            os.environ['IRSSG_DATA_PATH'] = path
-            break
-    else:
-        # If no data directory found, set to current working directory
-        os.environ['IRSSG_DATA_PATH'] = './kLittleGroups'
+    # Use the first existing directory, or the current working directory
+    # if none is found.  A value set by the user is left alone.
+    data_path = next((path for path in possible_paths if os.path.isdir(path)), './kLittleGroups')
+    os.environ.setdefault('IRSSG_DATA_PATH', data_path)
 
 # Set up data path when package is imported
 _setup_data_path()
 
-from .core import IRSSG, run_irssg
-
 __all__ = [
     "IRSSG",
+    "IRSSGPool",
     "run_irssg",
 ]
 
+
+def __getattr__(name):
+    """Import the wrapper classes on first access (PEP 562)"""
+    if name in __all__:
+        from . import core
+        return getattr(core, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    """Include the lazily imported names in dir(irssg)"""
+    return sorted(set(globals()) | set(__all__))
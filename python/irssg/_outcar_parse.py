@@ -0,0 +1,133 @@
+"""
+OUTCAR parser shared by the IRSSG utilities
+
+Kept in its own module so that the scanning loop has a single
+implementation to optimise.
+"""
+
+import mmap
+import re
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Optional, Union
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+# The header fields parse_outcar looks for, combined into a single bytes
+# pattern that is run over the memory-mapped file.  ``[ \t]`` is used instead
+# of ``\s`` so that no match can run past the end of its line.
+_OUTCAR_RE = re.compile(
+    rb"(?P<title>SYSTEM[ \t]*=[ \t]*(?P<title_value>[^\r\n]*?)[ \t]*\r?$)"
+    rb"|(?P<nkpts>NKPTS[ \t]*=[ \t]*(?P<num_k>\d+).*NBANDS[ \t]*=[ \t]*(?P<num_bands>\d+))"
+    rb"|(?P<ispin>ISPIN[ \t]*=[ \t]*(?P<nspin>\d+))",
+    re.MULTILINE,
+)
+
+# VASP repeats the lattice after every ionic step; only the last one is kept
+_LATTICE_TAG = b"direct lattice vectors"
+
+def parse_outcar(outcar_file: Union[str, Path]) -> Dict:
+    """
+    Parse the summary fields of an OUTCAR file
+    
+    Parameters
+    ----------
+    outcar_file : str or Path
+        Path to OUTCAR file
+        
+    Returns
+    -------
+    dict
+        Dictionary containing VASP calculation information
+    """
+    info = {
+        'num_sym': 0,
+        'num_k': 0,
+        'num_bands': 0,
+        'nspin': 1,
+        'title': '',
+        'lattice_vectors': None,
+        'kpoints': [],
+        'energies': []
+    }
+    
+    # Let open() report a missing file rather than probing with exists() first
+    try:
+        f = open(outcar_file, 'rb')
+    except FileNotFoundError:
+        raise FileNotFoundError(f"OUTCAR file not found: {outcar_file}") from None
+    
+    with f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            return info
+    
+    # The mapping stays in the page cache; only matched slices are copied
+    with mm:
+        # SYSTEM, NKPTS and ISPIN are printed once near the top, so the scan
+        # stops as soon as all three have been seen instead of running the
+        # pattern over the ionic steps that make up the rest of the file
+        found = set()
+        for match in _OUTCAR_RE.finditer(mm):
+            kind = match.lastgroup
+            
+            if kind == 'title':
+                info['title'] = match.group('title_value').decode('utf-8', 'replace')
+            elif kind == 'nkpts':
+                info['num_k'] = int(match.group('num_k'))
+                info['num_bands'] = int(match.group('num_bands'))
+            elif kind == 'ispin':
+                info['nspin'] = int(match.group('nspin'))
+            
+            found.add(kind)
+            if len(found) == 3:
+                break
+        
+        # Search backwards for the last complete lattice block; the final one
+        # may be cut short while VASP is still writing the file
+        pos = mm.rfind(_LATTICE_TAG)
+        while pos != -1:
+            lattice = _read_lattice_block(mm, pos + len(_LATTICE_TAG))
+            if lattice is not None:
+                info['lattice_vectors'] = lattice
+                break
+            pos = mm.rfind(_LATTICE_TAG, 0, pos)
+    
+    return info
+
+
+def _read_lattice_block(mm: mmap.mmap, pos: int) -> Optional["np.ndarray"]:
+    """Return the first three columns of the three lines following pos"""
+    import numpy as np
+    
+    # Skip the rest of the header line, then take the next three lines as
+    # one slice instead of copying them out of the map one by one
+    start = mm.find(b'\n', pos)
+    if start == -1:
+        return None
+    end = start
+    for _ in range(3):
+        end = mm.find(b'\n', end + 1)
+        if end == -1:
+            end = len(mm)
+            break
+    rows = mm[start + 1:end].splitlines()[:3]
+    if len(rows) < 3:
+        return None
+    
+    lattice = np.empty((3, 3))
+    for i, row in enumerate(rows):
+        # Each line holds the direct and the reciprocal vector side by
+        # side; NumPy parses the numbers in C and the direct part is kept
+        try:
+            values = np.fromstring(row.decode('ascii', 'replace'), sep=' ')
+        except ValueError:
+            return None
+        if values.size < 3:
+            return None
+        lattice[i] = values[:3]
+    
+    return lattice
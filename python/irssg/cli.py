@@ -7,63 +7,45 @@ It can be used as a standalone executable.
 """
 
 import argparse
+import functools
 import sys
 import os
 import subprocess
 from pathlib import Path
 
-# Set up data path environment variable for Fortran code
-def _setup_data_path():
-    """Set up the data path environment variable for Fortran code"""
-    # Get the directory where this package is installed
-    package_dir = Path(__file__).resolve().parent
-    
-    # Look for data directory in various possible locations
-    possible_paths = [
-        package_dir / 'data' / 'kLittleGroups',
-        package_dir / '..' / 'data' / 'kLittleGroups',
-        package_dir / '..' / '..' / 'data' / 'kLittleGroups',
-    ]
-    
-    # Set the environment variable to the first existing path
-    for path in possible_paths:
-        if path.exists():
-            os.environ['IRSSG_DATA_PATH'] = str(path)
-            break
-    else:
-        # If no data directory found, set to current working directory
-        os.environ['IRSSG_DATA_PATH'] = './kLittleGroups'
+if not __package__:
+    # Run as a script: make the package importable by its absolute name
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-# Set up data path when module is imported
-_setup_data_path()
+# Absolute imports so this file also works as a standalone script.
+# Importing irssg.core runs irssg/__init__.py first, which sets
+# IRSSG_DATA_PATH for the Fortran code
+from irssg.core import _CLOSE_FDS, _check_range, _irssg_argv, _resolve_irssg_path
 
 def find_irssg_executable():
     """Find the IRSSG Fortran executable"""
-    # First try to find it in the package's bin directory
-    package_dir = Path(__file__).resolve().parent
-    exe_path = package_dir / 'bin' / 'irssg'
-    
-    if exe_path.exists() and os.access(exe_path, os.X_OK):
-        return str(exe_path)
-    
-    # Fallback to system PATH
-    import shutil
-    system_path = shutil.which('irssg')
-    if system_path:
-        return system_path
-    
-    raise FileNotFoundError("IRSSG executable not found. Please ensure the package is properly installed.")
+    # Same search as IRSSG(): the packaged executable first, then PATH,
+    # skipping scripts such as the ``irssg`` entry point of this package
+    try:
+        return os.fspath(_resolve_irssg_path(None, os.getcwd(), os.environ.get("PATH")))
+    except (FileNotFoundError, PermissionError):
+        raise FileNotFoundError("IRSSG executable not found. Please ensure the package is properly installed.") from None
 
-def main():
-    """Main command line interface"""
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser (once per process)"""
     parser = argparse.ArgumentParser(
         description="IRSSG Python Interface",
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
 Examples:
   irssg                    # Run with default irssg.in
+  irssg -k 1 5             # Only analyse k-points 1-5
+  irssg -b 10 20           # Only analyse bands 10-20
+  irssg -w /path/to/vasp   # Run on files in another directory
   irssg -o output.log      # Redirect output to file
   irssg --validate         # Validate input files
+  irssg --list-space-groups  # List space groups with data
   irssg --version          # Show version information
 
 Note: This is a Python wrapper for the IRSSG Fortran code.
@@ -75,12 +57,46 @@ Note: This is a Python wrapper for the IRSSG Fortran code.
         help='Output file path (default: print to console)'
     )
     
+    parser.add_argument(
+        '-k', '--kpoints',
+        nargs=2, type=int, metavar=('START', 'END'),
+        help='Range of k-points to analyse (1-based, inclusive)'
+    )
+    
+    parser.add_argument(
+        '-b', '--bands',
+        nargs=2, type=int, metavar=('START', 'END'),
+        help='Range of bands to analyse (1-based, inclusive)'
+    )
+    
+    parser.add_argument(
+        '-w', '--work-dir',
+        help='Directory containing irssg.in, OUTCAR and WAVECAR (default: current directory)'
+    )
+    
+    parser.add_argument(
+        '--timeout',
+        type=float, metavar='SECONDS',
+        help='Stop the calculation after this many seconds (default: no limit)'
+    )
+    
+    parser.add_argument(
+        '--irssg-path',
+        help='Path to the IRSSG executable (default: search automatically)'
+    )
+    
     parser.add_argument(
         '--validate',
         action='store_true',
         help='Validate input files and exit'
     )
     
+    parser.add_argument(
+        '--list-space-groups',
+        action='store_true',
+        help='List space groups with kLittleGroups data and exit'
+    )
+    
     parser.add_argument(
         '--version',
         action='store_true',
@@ -94,15 +110,31 @@ Note: This is a Python wrapper for the IRSSG Fortran code.
         help='Input file path (default: irssg.in)'
     )
     
-    args = parser.parse_args()
+    return parser
+
+def main(argv=None):
+    """Main command line interface"""
+    args = _build_parser().parse_args(argv)
     
     if args.version:
-        print("IRSSG Python Interface v0.1.0")
+        from irssg import __version__
+        print(f"IRSSG Python Interface v{__version__}")
+        return 0
+    
+    if args.list_space_groups:
+        from irssg.utils import list_available_space_groups
+        try:
+            space_groups = list_available_space_groups()
+        except FileNotFoundError as e:
+            print(f"Error: {e}")
+            return 1
+        print(f"Available space groups ({len(space_groups)}):")
+        print(" ".join(str(sg) for sg in space_groups))
         return 0
     
     if args.validate:
         # Validate input files
-        input_file = Path(args.input_file)
+        input_file = Path(args.work_dir or '.') / args.input_file
         if not input_file.exists():
             print(f"Error: Input file '{input_file}' not found")
             return 1
@@ -110,34 +142,55 @@ Note: This is a Python wrapper for the IRSSG Fortran code.
         print(f"Input file '{input_file}' is valid")
         return 0
     
-    # Find the IRSSG executable
     try:
-        irssg_exe = find_irssg_executable()
-    except FileNotFoundError as e:
+        _check_range('k-point', args.kpoints)
+        _check_range('band', args.bands)
+    except ValueError as e:
         print(f"Error: {e}")
         return 1
     
+    if args.work_dir is not None and not os.path.isdir(args.work_dir):
+        print(f"Error: Work directory '{args.work_dir}' not found")
+        return 1
+    
+    # Find the IRSSG executable
+    if args.irssg_path:
+        # Absolute, because the executable is started in the work directory
+        irssg_exe = os.path.abspath(os.path.expanduser(args.irssg_path))
+        if not (os.path.isfile(irssg_exe) and os.access(irssg_exe, os.X_OK)):
+            print(f"Error: IRSSG executable not found or not executable: {irssg_exe}")
+            return 1
+    else:
+        try:
+            irssg_exe = find_irssg_executable()
+        except FileNotFoundError as e:
+            print(f"Error: {e}")
+            return 1
+    
     # Prepare command
-    cmd = [irssg_exe]
+    cmd = _irssg_argv(irssg_exe, args.kpoints, args.bands)
     
-    # Set up output redirection
+    # The executable writes straight to the output file or the terminal, so
+    # nothing is buffered in Python and progress is visible while it runs
+    sys.stdout.flush()
     if args.output:
         try:
-            with open(args.output, 'w') as f:
-                result = subprocess.run(cmd, stdout=f, stderr=subprocess.PIPE, text=True)
-        except Exception as e:
+            f = open(args.output, 'w')
+        except OSError as e:
             print(f"Error writing to output file: {e}")
             return 1
-    else:
-        # Run and capture output
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        
-        # Print output
-        if result.stdout:
-            print(result.stdout)
-        if result.stderr:
-            print("STDERR:", file=sys.stderr)
-            print(result.stderr, file=sys.stderr)
+    
+    try:
+        if args.output:
+            with f:
+                result = subprocess.run(cmd, stdout=f, cwd=args.work_dir,
+                                        timeout=args.timeout, close_fds=_CLOSE_FDS)
+        else:
+            result = subprocess.run(cmd, cwd=args.work_dir, timeout=args.timeout, close_fds=_CLOSE_FDS)
+    except subprocess.TimeoutExpired:
+        # Everything written before the deadline is kept in the output
+        print(f"Error: IRSSG did not finish within {args.timeout:g} seconds")
+        return 1
     
     return result.returncode
 
@@ -2,11 +2,279 @@
 Core Python wrapper for IRSSG Fortran program
 """
 
+import functools
 import os
+import shutil
 import subprocess
-import numpy as np
+import sys
 from pathlib import Path
-from typing import Optional, List
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Optional, Tuple, Union
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+    
+    import numpy as np
+
+# Directory of the installed package
+_PKG_DIR = Path(__file__).resolve().parent
+
+# Executable installed into the wheel by meson, looked up once at import
+_PACKAGED_EXE = _PKG_DIR / "bin" / "irssg"
+_DEFAULT_IRSSG = (os.fspath(_PACKAGED_EXE)
+                  if _PACKAGED_EXE.is_file() and os.access(_PACKAGED_EXE, os.X_OK) else None)
+
+
+def _close_fds_is_cheap() -> bool:
+    """Return False where close_fds=True makes the child close descriptors one by one"""
+    if not sys.platform.startswith("linux"):
+        return True
+    # CPython 3.10+ closes them with a single close_range() call, which
+    # Linux supports (with the flags CPython needs) from 5.11 on
+    release = os.uname().release.split("-")[0].split(".")
+    try:
+        kernel = (int(release[0]), int(release[1]))
+    except (IndexError, ValueError):
+        return True
+    return sys.version_info >= (3, 10) and kernel >= (5, 11)
+
+
+# close_fds for every spawned executable.  The default is kept unless it
+# costs a close() per possible descriptor, which on nodes with a large
+# open-file limit adds up.  Turning it off is acceptable there because
+# descriptors opened by Python are non-inheritable anyway (PEP 446); only
+# descriptors leaked by C extensions would reach the child.
+_CLOSE_FDS = _close_fds_is_cheap()
+
+# Files that must be present before IRSSG can run
+_REQUIRED_INPUTS = ("OUTCAR", "WAVECAR")
+
+# Files the executable reads from its working directory
+_SHARD_INPUTS = ("irssg.in", "OUTCAR", "WAVECAR", "kLittleGroups")
+
+
+def _check_range(name: str, selection: Optional[Tuple[int, int]]) -> None:
+    """Raise ValueError unless selection is a 1-based inclusive (start, end) range"""
+    if selection is None:
+        return
+    start, end = selection
+    if not 1 <= start <= end:
+        raise ValueError(f"invalid {name} range {start}-{end}")
+
+
+def _scan_missing_inputs(work_dir: str) -> Tuple[str, ...]:
+    """
+    Return the required input files absent from work_dir
+    
+    Only names are compared; a dangling OUTCAR or WAVECAR symlink counts
+    as present.
+    """
+    # One directory listing instead of a stat per required file
+    try:
+        with os.scandir(work_dir) as entries:
+            present = {entry.name for entry in entries if entry.name in _REQUIRED_INPUTS}
+    except OSError:
+        # Not a directory, or not listable
+        return _REQUIRED_INPUTS
+    return tuple(name for name in _REQUIRED_INPUTS if name not in present)
+
+
+@functools.lru_cache(maxsize=128)
+def _missing_inputs(work_dir: str, dir_mtime_ns: int) -> Tuple[str, ...]:
+    """
+    _scan_missing_inputs, cached per directory and mtime
+    
+    The mtime changes whenever an entry is added, removed or renamed, so
+    repeated checks of an unchanged directory cost a single stat().  On
+    file systems with coarse mtimes a file removed in the same tick as an
+    earlier check can be missed; IRSSG.validate_input.cache_clear()
+    forgets all entries.
+    """
+    return _scan_missing_inputs(work_dir)
+
+
+def _irssg_argv(exe: Union[str, "os.PathLike[str]"], k_range: Optional[Tuple[int, int]],
+                band_range: Optional[Tuple[int, int]]) -> List[str]:
+    """Build the argument list for the executable; shared by IRSSG and the CLI"""
+    # Only the requested window is handed to the Fortran k/band loops
+    return [
+        os.fspath(exe),
+        *(('-nk', str(k_range[0]), str(k_range[1])) if k_range is not None else ()),
+        *(('-nb', str(band_range[0]), str(band_range[1])) if band_range is not None else ()),
+    ]
+
+
+def _split_range(start: int, end: int, nproc: int) -> List[Tuple[int, int]]:
+    """Split an inclusive range into at most nproc contiguous, balanced chunks"""
+    count = end - start + 1
+    nproc = max(1, min(nproc, count))
+    size, extra = divmod(count, nproc)
+    
+    chunks = []
+    first = start
+    for i in range(nproc):
+        last = first + size - 1 + (1 if i < extra else 0)
+        chunks.append((first, last))
+        first = last + 1
+    return chunks
+
+
+def _link_inputs(src_dir: str, dst_dir: str) -> None:
+    """Make the IRSSG input files of src_dir visible in dst_dir without copying WAVECAR"""
+    for name in _SHARD_INPUTS:
+        src = os.path.join(src_dir, name)
+        if not os.path.exists(src):
+            continue
+        dst = os.path.join(dst_dir, name)
+        try:
+            os.symlink(src, dst)
+        except OSError:
+            # e.g. Windows without symlink privilege
+            if os.path.isdir(src):
+                shutil.copytree(src, dst)
+            else:
+                try:
+                    os.link(src, dst)
+                except OSError:
+                    shutil.copyfile(src, dst)
+
+
+# Directories searched for an executable named irssg when no path is given,
+# relative to the current directory
+_CANDIDATE_DIRS = (
+    ".",
+    "src_irssg",
+    "../src_irssg",
+    "../../src_irssg",
+    "fortran/src",  # New project structure
+    "../fortran/src",
+    "../../fortran/src",
+)
+
+
+@functools.lru_cache(maxsize=8)
+def _which_irssg(path_env: Optional[str]) -> Optional[str]:
+    """shutil.which('irssg'), remembered for each value of $PATH"""
+    return shutil.which("irssg", path=path_env)
+
+
+def _candidate_executables(path_env: Optional[str]) -> Iterator[str]:
+    """Yield executable files named irssg on path_env and in _CANDIDATE_DIRS, in search order"""
+    # The system PATH takes precedence
+    system_irssg = _which_irssg(path_env)
+    if system_irssg:
+        yield system_irssg
+    
+    # One directory listing per candidate instead of a stat per probe; the
+    # DirEntry already knows the file type and usually its mode bits
+    for directory in _CANDIDATE_DIRS:
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if (entry.name == "irssg" and entry.is_file()
+                            and entry.stat().st_mode & 0o111):
+                        yield entry.path
+                        break
+        except OSError:
+            continue
+
+
+def _is_script(path: str) -> bool:
+    """Return True if path starts with a ``#!`` line rather than binary code"""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        # If we can't read it, assume it's a binary
+        return False
+    try:
+        return os.read(fd, 2) == b'#!'
+    finally:
+        os.close(fd)
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_irssg_path(irssg_path: Optional[str], cwd: str, path_env: Optional[str]) -> Path:
+    """
+    Locate and check the IRSSG executable
+    
+    The result is cached per (irssg_path, cwd, path_env): relative paths,
+    including the fallback candidates, are looked up from the current
+    directory, and the automatic search consults $PATH first.  Failed
+    lookups raise and are therefore never cached.
+    """
+    if irssg_path is None:
+        # The executable shipped with the package needs no search
+        irssg_path = _DEFAULT_IRSSG
+    
+    if irssg_path is None:
+        # Try to find the executable automatically, skipping scripts such
+        # as the ``irssg`` entry point of this package
+        irssg_path = next((path for path in _candidate_executables(path_env) if not _is_script(path)), None)
+    
+    if irssg_path is not None:
+        irssg_path = os.path.expanduser(irssg_path)
+    
+    if irssg_path is None or not os.path.exists(irssg_path):
+        raise FileNotFoundError(f"IRSSG executable not found. Please specify the correct path.")
+    
+    # Absolute, because runs are started in other directories; symlinks
+    # need not be followed for that, which saves a readlink per component
+    resolved = Path(os.path.abspath(irssg_path))
+    
+    if not os.access(resolved, os.X_OK):
+        raise PermissionError(f"IRSSG executable {resolved} is not executable")
+    
+    return resolved
+
+
+class _LazyTextResult(subprocess.CompletedProcess):
+    """
+    CompletedProcess holding captured bytes that are decoded on first access
+    
+    ``stdout`` and ``stderr`` read as UTF-8 text (invalid bytes replaced)
+    like a text-mode run, but callers that only look at ``returncode``
+    never pay for decoding a large output.  Until then the bytes are kept
+    in ``raw_stdout`` and ``raw_stderr``.
+    """
+    
+    @property
+    def stdout(self) -> Optional[str]:
+        if isinstance(self.raw_stdout, bytes):
+            self.raw_stdout = self.raw_stdout.decode('utf-8', errors='replace')
+        return self.raw_stdout
+    
+    @stdout.setter
+    def stdout(self, value) -> None:
+        self.raw_stdout = value
+    
+    @property
+    def stderr(self) -> Optional[str]:
+        if isinstance(self.raw_stderr, bytes):
+            self.raw_stderr = self.raw_stderr.decode('utf-8', errors='replace')
+        return self.raw_stderr
+    
+    @stderr.setter
+    def stderr(self, value) -> None:
+        self.raw_stderr = value
+    
+    def kpoint_headers(self) -> Tuple["np.ndarray", "np.ndarray"]:
+        """
+        Parse the k-point headers of the captured output
+        
+        Returns
+        -------
+        tuple
+            The structured array and k-point names returned by
+            ``irssg.utils.parse_kpoint_headers``
+            
+        Raises
+        ------
+        ValueError
+            If stdout was not captured (capture=False or output_file)
+        """
+        if self.stdout is None:
+            raise ValueError("stdout was not captured")
+        from .utils import parse_kpoint_headers
+        return parse_kpoint_headers(self.stdout)
 
 
 class IRSSG:
@@ -26,115 +294,225 @@ class IRSSG:
             Path to the IRSSG Fortran executable
             If None, tries to find it automatically
         """
-        if irssg_path is None:
-            # Try to find the executable automatically
-            possible_paths = [
-                "irssg",  # Current directory
-                "src_irssg/irssg",
-                "../src_irssg/irssg",
-                "../../src_irssg/irssg",
-                "fortran/src/irssg",  # New project structure
-                "../fortran/src/irssg",
-                "../../fortran/src/irssg"
-            ]
-            
-            # Also check system PATH
-            import shutil
-            system_irssg = shutil.which("irssg")
-            if system_irssg:
-                possible_paths.insert(0, system_irssg)
-            
-            for path in possible_paths:
-                if os.path.exists(path) and os.access(path, os.X_OK):
-                    # Check if it's not a Python script
-                    try:
-                        with open(path, 'rb') as f:
-                            first_line = f.readline().decode('utf-8', errors='ignore').strip()
-                            if not first_line.startswith('#!'):
-                                irssg_path = path
-                                break
-                    except:
-                        # If we can't read it, assume it's a binary
-                        irssg_path = path
-                        break
-        
-        if irssg_path is None or not os.path.exists(irssg_path):
-            raise FileNotFoundError(f"IRSSG executable not found. Please specify the correct path.")
+        self.irssg_path = _resolve_irssg_path(irssg_path, os.getcwd(), os.environ.get("PATH"))
         
-        # Expand user directory and resolve path
-        self.irssg_path = Path(os.path.expanduser(irssg_path)).resolve()
+        # argv[0] for every run; stringified once rather than per call
+        self._exe = os.fspath(self.irssg_path)
+    
+    @classmethod
+    def from_resolved(cls, path: Union[str, Path]) -> "IRSSG":
+        """
+        Create a wrapper for an executable the caller has already checked
         
-        # Final check: ensure it's not a Python script
-        try:
-            with open(self.irssg_path, 'rb') as f:
-                first_line = f.readline().decode('utf-8', errors='ignore').strip()
-                if first_line.startswith('#!'):
-                    raise FileNotFoundError(f"Found Python script instead of executable: {self.irssg_path}")
-        except:
-            pass  # If we can't read it, assume it's a binary
+        No lookup or validation is done; the path is only made absolute,
+        since runs are started in other directories.
         
-        if not os.access(self.irssg_path, os.X_OK):
-            raise PermissionError(f"IRSSG executable {self.irssg_path} is not executable")
+        Parameters
+        ----------
+        path : str or Path
+            Path to the IRSSG executable, e.g. the ``irssg_path`` of an
+            existing instance
+        """
+        irssg = cls.__new__(cls)
+        irssg.irssg_path = Path(os.path.abspath(path))
+        irssg._exe = os.fspath(irssg.irssg_path)
+        return irssg
     
-    def run(self, timeout: Optional[int] = None) -> subprocess.CompletedProcess:
+    @staticmethod
+    def invalidate_path_cache() -> None:
+        """Forget executables located by earlier instances, e.g. after reinstalling"""
+        _resolve_irssg_path.cache_clear()
+        _which_irssg.cache_clear()
+    
+    def run(self, work_dir: Optional[str] = None, timeout: Optional[float] = None,
+            k_range: Optional[Tuple[int, int]] = None,
+            band_range: Optional[Tuple[int, int]] = None,
+            nproc: int = 1, output_file: Optional[str] = None,
+            capture: bool = True) -> subprocess.CompletedProcess:
         """
         Run the IRSSG program
         
         Parameters
         ----------
-        timeout : int, optional
-            Timeout in seconds
+        work_dir : str, optional
+            Directory containing irssg.in, OUTCAR and WAVECAR.
+            The executable is started there instead of changing the
+            working directory of the Python process.
+        timeout : float, optional
+            Timeout in seconds; no limit by default.  On expiry the
+            executable is killed and subprocess.TimeoutExpired is raised
+            unchanged, with the output captured up to that point in its
+            ``stdout`` and ``stderr`` attributes (as bytes), or left in
+            output_file.  With nproc > 1 the exception is that of one
+            timed-out chunk and carries only that chunk's captured output;
+            output_file still receives what every chunk had written.
+        k_range : tuple of int, optional
+            First and last k-point (1-based, inclusive) to analyse.
+            Passed to the executable as ``-nk``; by default all k-points
+            in the WAVECAR are processed.
+        band_range : tuple of int, optional
+            First and last band (1-based, inclusive), passed as ``-nb``
+        nproc : int
+            Number of executables to run concurrently.  The k-point window
+            (all k-points in the OUTCAR if k_range is not given) is split
+            into contiguous chunks; the first chunk runs in work_dir and
+            the others in temporary directories linking to its input
+            files.  The result is not identical to a serial run: the
+            output is the chunks' outputs one after another, each with
+            its own preamble, and with ISPIN=2 every chunk prints its
+            spin-up k-points before its spin-down ones.  The ``*.mat``
+            files left in work_dir come from the first chunk only.
+        output_file : str, optional
+            Write the standard output of the executable to this file
+            instead of capturing it.  The child writes to the file
+            directly, so ``stdout`` of the result is None.
+        capture : bool
+            Capture the output of the executable.  With False it writes
+            straight to the standard output and error of the Python
+            process (stdout still goes to output_file if given), no pipes
+            are set up, and ``stdout``/``stderr`` of the result are None.
+            With nproc > 1 the output of the chunks is then interleaved.
             
         Returns
         -------
         subprocess.CompletedProcess
-            Result of the subprocess call
+            Result of the subprocess call.  The captured output is
+            decoded as UTF-8 the first time ``stdout`` or ``stderr`` is
+            read.  For a run split with nproc > 1, ``args`` is the list of
+            the commands run for the chunks, ``chunks`` holds the result
+            of each chunk, and ``returncode`` is the first non-zero one.
+            ``kpoint_headers()`` parses the k-point headers of the
+            captured output into NumPy arrays.
+            
+        Raises
+        ------
+        ValueError
+            If k_range or band_range is not a valid range
         """
-        if not self.irssg_path:
-            raise FileNotFoundError("IRSSG executable not found. Please specify the correct path.")
+        # None lets the child inherit our working directory without a getcwd()
+        cwd = os.fspath(work_dir) if work_dir is not None else None
         
-        try:
-            result = subprocess.run(
-                [self.irssg_path],
-                capture_output=True,
-                text=True,
-                encoding='utf-8',
-                errors='replace',  # Replace invalid characters instead of failing
-                timeout=timeout,
-                cwd=os.getcwd()
-            )
-            return result
-        except subprocess.TimeoutExpired:
-            # Kill the process if it times out
-            raise subprocess.TimeoutExpired([self.irssg_path], timeout)
-        except UnicodeDecodeError as e:
-            # Fallback to binary mode if text mode fails
-            try:
-                result = subprocess.run(
-                    [self.irssg_path],
-                    capture_output=True,
-                    text=False,  # Use binary mode
-                    timeout=timeout,
-                    cwd=os.getcwd()
-                )
-                # Try to decode with error handling
-                stdout = result.stdout.decode('utf-8', errors='replace') if result.stdout else ""
-                stderr = result.stderr.decode('utf-8', errors='replace') if result.stderr else ""
-                
-                # Create a new CompletedProcess with decoded text
-                return subprocess.CompletedProcess(
-                    [self.irssg_path],
-                    result.returncode,
-                    stdout=stdout,
-                    stderr=stderr
-                )
-            except Exception as fallback_error:
-                raise RuntimeError(f"Failed to run IRSSG: {e}. Fallback also failed: {fallback_error}")
+        # Reject bad windows here instead of after the executable has
+        # already read OUTCAR and WAVECAR
+        _check_range("k-point", k_range)
+        _check_range("band", band_range)
+        
+        if nproc > 1:
+            if k_range is None:
+                from .utils import read_vasp_output
+                num_k = read_vasp_output(os.path.join(cwd or os.curdir, "OUTCAR"))['num_k']
+                k_range = (1, num_k) if num_k else None
+            if k_range is not None and k_range[1] > k_range[0]:
+                return self._run_sharded(cwd, timeout, k_range, band_range, nproc, output_file, capture)
+        
+        return self._run_once(self._command(k_range, band_range), cwd, timeout, output_file, capture)
+    
+    def _command(self, k_range: Optional[Tuple[int, int]],
+                 band_range: Optional[Tuple[int, int]]) -> List[str]:
+        """Build the argument list for one invocation of the executable"""
+        return _irssg_argv(self._exe, k_range, band_range)
+    
+    def _run_sharded(self, cwd: Optional[str], timeout: Optional[float], k_range: Tuple[int, int],
+                     band_range: Optional[Tuple[int, int]], nproc: int,
+                     output_file: Optional[str], capture: bool) -> subprocess.CompletedProcess:
+        """Run contiguous k-point chunks concurrently and merge their output"""
+        # Only needed here; importing them at module level would slow down
+        # every CLI start for the sake of nproc > 1
+        import tempfile
+        from concurrent.futures import ThreadPoolExecutor
+        
+        chunks = _split_range(k_range[0], k_range[1], nproc)
+        # Absolute, since the other chunks link to its files from elsewhere
+        src_dir = os.path.abspath(cwd or os.curdir)
+        
+        with tempfile.TemporaryDirectory(prefix="irssg_") as tmp_dir:
+            # The first chunk runs in place; the *.mat files the other
+            # chunks write are discarded with the temporary directory
+            shard_dirs = [src_dir]
+            for i in range(1, len(chunks)):
+                shard_dir = os.path.join(tmp_dir, f"k{chunks[i][0]}-{chunks[i][1]}")
+                os.mkdir(shard_dir)
+                _link_inputs(src_dir, shard_dir)
+                shard_dirs.append(shard_dir)
+            
+            # With an output file every chunk writes its own part, and the
+            # parts are joined in chunk order once all have finished
+            if output_file is not None:
+                shard_outputs = [os.path.join(tmp_dir, f"k{first}-{last}.out") for first, last in chunks]
+            else:
+                shard_outputs = [None] * len(chunks)
+            
+            # Each worker thread just waits on its own child process; leaving
+            # the block waits for all of them, even if one has failed
+            with ThreadPoolExecutor(max_workers=len(chunks)) as executor:
+                futures = [
+                    executor.submit(self._run_once, self._command(chunk, band_range),
+                                    shard_dir, timeout, shard_output, capture)
+                    for chunk, shard_dir, shard_output in zip(chunks, shard_dirs, shard_outputs)
+                ]
+            
+            # Joined before any error is raised, so that after a timeout the
+            # output written so far is kept as for a serial run
+            if output_file is not None:
+                with open(output_file, 'wb') as out:
+                    for shard_output in shard_outputs:
+                        try:
+                            f = open(shard_output, 'rb')
+                        except FileNotFoundError:
+                            continue
+                        with f:
+                            shutil.copyfileobj(f, out)
+        
+        error = next((future.exception() for future in futures if future.exception()), None)
+        if error is not None:
+            raise error
+        results = [future.result() for future in futures]
+        
+        # Joined as bytes so that nothing is decoded unless it is read
+        merged = _LazyTextResult(
+            [r.args for r in results],
+            next((r.returncode for r in results if r.returncode), 0),
+            stdout=None if output_file is not None or not capture else b"".join(r.raw_stdout for r in results),
+            stderr=b"".join(r.raw_stderr for r in results) if capture else None,
+        )
+        merged.chunks = results
+        return merged
+    
+    def _run_once(self, cmd: List, cwd: Optional[str], timeout: Optional[float],
+                  output_file: Optional[str] = None,
+                  capture: bool = True) -> subprocess.CompletedProcess:
+        """Run the executable once, writing stdout to output_file or capturing it if requested"""
+        # Without capture the child inherits our stdout and stderr
+        stderr = subprocess.PIPE if capture else None
+        if output_file is None:
+            return self._spawn(cmd, cwd, timeout, subprocess.PIPE if capture else None, stderr)
+        
+        # The child writes into the file itself; nothing passes through Python
+        with open(output_file, 'wb') as f:
+            return self._spawn(cmd, cwd, timeout, f, stderr)
+    
+    def _spawn(self, cmd: List, cwd: Optional[str], timeout: Optional[float],
+               stdout, stderr) -> subprocess.CompletedProcess:
+        """Run the executable with the given stdout and stderr"""
+        # Captured as bytes; the text is only decoded if the caller reads it
+        result = subprocess.run(
+            cmd,
+            stdout=stdout,
+            stderr=stderr,
+            timeout=timeout,
+            cwd=cwd,
+            close_fds=_CLOSE_FDS
+        )
+        
+        return _LazyTextResult(cmd, result.returncode, result.stdout, result.stderr)
     
     def validate_input(self, work_dir: Optional[str] = None) -> bool:
         """
         Validate that required input files exist
         
+        Directories found complete are remembered until their mtime
+        changes; ``IRSSG.validate_input.cache_clear()`` forgets them.
+        
         Parameters
         ----------
         work_dir : str, optional
@@ -148,27 +526,107 @@ class IRSSG:
         if work_dir is None:
             work_dir = os.getcwd()
         
-        required_files = ["OUTCAR", "WAVECAR"]
+        try:
+            dir_mtime_ns = os.stat(work_dir).st_mtime_ns
+        except OSError:
+            missing = _REQUIRED_INPUTS
+        else:
+            abs_dir = os.path.abspath(work_dir)
+            missing = _missing_inputs(abs_dir, dir_mtime_ns)
+            if missing:
+                # A file added within the same mtime tick would not have
+                # changed the key, so a negative answer is always rechecked
+                missing = _scan_missing_inputs(abs_dir)
         
-        for filename in required_files:
-            filepath = os.path.join(work_dir, filename)
-            if not os.path.exists(filepath):
-                print(f"Warning: Required file {filename} not found in {work_dir}")
-                return False
+        if missing:
+            print(f"Warning: Required file {missing[0]} not found in {work_dir}")
+            return False
         
         return True
 
 
-def run_irssg(irssg_path: Optional[str] = None, work_dir: Optional[str] = None, **kwargs) -> subprocess.CompletedProcess:
+# Same spelling as an lru_cache-decorated function
+IRSSG.validate_input.cache_clear = _missing_inputs.cache_clear
+
+
+class IRSSGPool:
+    """
+    Run IRSSG on many calculations with a bounded number of executables
+    
+    The executable is located once and shared by all jobs.  Each job is
+    an ordinary ``IRSSG.run`` call on a worker thread; the threads only
+    wait on their child processes, so the Fortran runs themselves use
+    separate cores.  Every job must have its own ``work_dir``.
+    
+    Examples
+    --------
+    >>> with IRSSGPool(size=4) as pool:
+    ...     results = list(pool.map(["Cr2Sb", "MnTe", "NiO"]))
+    """
+    
+    def __init__(self, size: int = 4, irssg_path: Optional[str] = None):
+        """
+        Initialize the pool
+        
+        Parameters
+        ----------
+        size : int
+            Maximum number of executables running at the same time
+        irssg_path : str, optional
+            Path to the IRSSG executable, found automatically if None
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        
+        self.irssg = IRSSG(irssg_path)
+        self._executor = ThreadPoolExecutor(max_workers=size, thread_name_prefix="irssg")
+    
+    def submit(self, work_dir: str, **kwargs) -> "Future":
+        """
+        Queue one run
+        
+        Parameters
+        ----------
+        work_dir : str
+            Directory containing irssg.in, OUTCAR and WAVECAR
+        **kwargs :
+            Additional arguments for ``IRSSG.run``
+            
+        Returns
+        -------
+        concurrent.futures.Future
+            Future resolving to the subprocess.CompletedProcess
+        """
+        return self._executor.submit(self.irssg.run, work_dir, **kwargs)
+    
+    def map(self, work_dirs: Iterable[str], **kwargs) -> Iterator[subprocess.CompletedProcess]:
+        """Run every directory in work_dirs and yield the results in the same order"""
+        return self._executor.map(functools.partial(self.irssg.run, **kwargs), work_dirs)
+    
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop accepting jobs; with wait, block until the queued ones have finished"""
+        self._executor.shutdown(wait=wait)
+    
+    def __enter__(self) -> "IRSSGPool":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.shutdown()
+
+
+def run_irssg(irssg_path: Optional[Union[str, Path]] = None, work_dir: Optional[str] = None,
+              resolved: bool = False, **kwargs) -> subprocess.CompletedProcess:
     """
     Convenience function to run IRSSG
     
     Parameters
     ----------
-    irssg_path : str, optional
+    irssg_path : str or Path, optional
         Path to the IRSSG executable
     work_dir : str, optional
         Working directory
+    resolved : bool
+        Use irssg_path as given, without locating or checking it (see
+        IRSSG.from_resolved).  Requires irssg_path.
     **kwargs : 
         Additional arguments for IRSSG
         
@@ -177,6 +635,11 @@ def run_irssg(irssg_path: Optional[str] = None, work_dir: Optional[str] = None,
     subprocess.CompletedProcess
         Result of the subprocess call
     """
-    irssg = IRSSG(irssg_path)
+    if resolved:
+        if irssg_path is None:
+            raise ValueError("resolved=True requires irssg_path")
+        irssg = IRSSG.from_resolved(irssg_path)
+    else:
+        irssg = IRSSG(irssg_path)
     return irssg.run(work_dir, **kwargs)
 
@@ -3,12 +3,31 @@ Utility functions for IRSSG package
 """
 
 import os
-import numpy as np
+import re
+import copy
+import mmap
+import stat
+import json
+import hashlib
+import functools
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Dict, FrozenSet, List, Optional, Tuple, Union
 
+from ._outcar_parse import parse_outcar
 
-def read_vasp_output(outcar_path: str = "OUTCAR") -> Dict:
+# NumPy is imported inside the functions that need it so that the CLI paths
+# which never touch arrays do not pay for it at startup
+if TYPE_CHECKING:
+    import numpy as np
+
+
+# Parsed OUTCAR summaries are cached next to the OUTCAR under this prefix
+_CACHE_PREFIX = ".irssg_cache_"
+# Number of cache files kept per directory
+_CACHE_KEEP = 8
+
+
+def read_vasp_output(outcar_path: str = "OUTCAR", use_cache: bool = False) -> Dict:
     """
     Read basic information from VASP OUTCAR file
     
@@ -16,6 +35,10 @@ def read_vasp_output(outcar_path: str = "OUTCAR") -> Dict:
     ----------
     outcar_path : str
         Path to OUTCAR file
+    use_cache : bool
+        Store the parsed summary in a small JSON file next to the OUTCAR
+        and reuse it while the OUTCAR size and modification time are
+        unchanged
         
     Returns
     -------
@@ -23,57 +46,119 @@ def read_vasp_output(outcar_path: str = "OUTCAR") -> Dict:
         Dictionary containing VASP calculation information
     """
     outcar_file = Path(outcar_path)
-    if not outcar_file.exists():
-        raise FileNotFoundError(f"OUTCAR file not found: {outcar_file}")
+    try:
+        st = outcar_file.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"OUTCAR file not found: {outcar_file}") from None
     
-    info = {
-        'num_sym': 0,
-        'num_k': 0,
-        'num_bands': 0,
-        'nspin': 1,
-        'title': '',
-        'lattice_vectors': None,
-        'kpoints': [],
-        'energies': []
-    }
+    # The stat signature identifies the file and invalidates the entry as
+    # soon as VASP rewrites it; callers get a private copy to mutate
+    info = _outcar_summary(os.path.abspath(outcar_file), st.st_mtime_ns, st.st_size, use_cache)
+    return copy.deepcopy(info)
+
+
+@functools.lru_cache(maxsize=32)
+def _outcar_summary(outcar_path: str, mtime_ns: int, size: int, use_cache: bool) -> Dict:
+    """Parse an OUTCAR once per (path, mtime, size), consulting the disk cache if enabled"""
+    if not use_cache:
+        return parse_outcar(outcar_path)
     
-    with open(outcar_file, 'r') as f:
-        lines = f.readlines()
+    outcar_file = Path(outcar_path)
+    key = hashlib.blake2b(
+        f"{outcar_file.name}:{size}:{mtime_ns}".encode(), digest_size=8
+    ).hexdigest()
+    cache_file = outcar_file.parent / f"{_CACHE_PREFIX}{key}.json"
     
-    for i, line in enumerate(lines):
-        line = line.strip()
-        
-        # Read title
-        if 'SYSTEM =' in line:
-            info['title'] = line.split('=')[1].strip()
-        
-        # Read number of k-points and bands
-        if 'k-points' in line and 'NKPTS' in line:
-            parts = line.split()
-            for j, part in enumerate(parts):
-                if part == 'NKPTS':
-                    info['num_k'] = int(parts[j+1])
-                elif part == 'NBANDS':
-                    info['num_bands'] = int(parts[j+1])
-        
-        # Read spin polarization
-        if 'ISPIN' in line:
-            info['nspin'] = int(line.split('=')[1])
-        
-        # Read lattice vectors
-        if 'direct lattice vectors' in line:
-            lattice = []
-            for j in range(3):
-                if i + j + 1 < len(lines):
-                    parts = lines[i + j + 1].split()
-                    if len(parts) >= 3:
-                        lattice.append([float(x) for x in parts[:3]])
-            if len(lattice) == 3:
-                info['lattice_vectors'] = np.array(lattice)
+    try:
+        with open(cache_file, 'r') as f:
+            info = json.load(f)
+    except (OSError, ValueError):
+        pass
+    else:
+        if info['lattice_vectors'] is not None:
+            import numpy as np
+            info['lattice_vectors'] = np.array(info['lattice_vectors'])
+        return info
     
+    info = parse_outcar(outcar_file)
+    _write_outcar_cache(cache_file, info)
     return info
 
 
+def _write_outcar_cache(cache_file: Path, info: Dict) -> None:
+    """Write a parsed OUTCAR summary and prune old cache files"""
+    data = dict(info)
+    if data['lattice_vectors'] is not None:
+        data['lattice_vectors'] = data['lattice_vectors'].tolist()
+    
+    tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        with open(tmp_file, 'w') as f:
+            json.dump(data, f)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        # A read-only calculation directory just means no caching
+        return
+    
+    old_files = sorted(cache_file.parent.glob(f"{_CACHE_PREFIX}*.json"),
+                       key=lambda p: p.stat().st_mtime_ns, reverse=True)
+    for old_file in old_files[_CACHE_KEEP:]:
+        try:
+            old_file.unlink()
+        except OSError:
+            pass
+
+
+# Per k-point header written by the Fortran driver.  The coordinates use a
+# fixed-width F9.6 edit descriptor, so negative values may not be separated
+# by whitespace and have to be sliced by column.
+_KPOINT_HEADER_RE = re.compile(
+    r"knum =\s*(?P<knum>\d+)(?: spin = (?P<spin>[^\n]*?))?[ \t]*\n"
+    r"K = (?P<kx>.{9})(?P<ky>.{9})(?P<kz>.{9})(?: kname = (?P<kname_inline>\S*))?[^\n]*\n"
+    r"(?:kname = (?P<kname>\S*))?"
+)
+
+_KPOINT_FIELDS = [
+    ('k_point', 'i4'),
+    ('spin', 'U10'),
+    ('k_coords', 'f8', (3,)),
+]
+
+
+def parse_kpoint_headers(output: str) -> Tuple["np.ndarray", "np.ndarray"]:
+    """
+    Extract the k-point headers from IRSSG standard output
+    
+    Parameters
+    ----------
+    output : str
+        Text printed by the IRSSG executable
+        
+    Returns
+    -------
+    tuple
+        Structured array with ``k_point``, ``spin`` and ``k_coords``
+        fields (one row per k-point block) and an object array with the
+        matching k-point names
+    """
+    import numpy as np
+    
+    matches = list(_KPOINT_HEADER_RE.finditer(output))
+    
+    results = np.empty(len(matches), dtype=np.dtype(_KPOINT_FIELDS))
+    k_names = np.empty(len(matches), dtype=object)
+    
+    for i, match in enumerate(matches):
+        results[i] = (
+            int(match.group('knum')),
+            match.group('spin') or '',
+            (float(match.group('kx')), float(match.group('ky')), float(match.group('kz'))),
+        )
+        k_names[i] = match.group('kname_inline') or match.group('kname') or ''
+    
+    return results, k_names
+
+
 def read_wavecar(wavecar_path: str = "WAVECAR") -> Dict:
     """
     Read basic information from VASP WAVECAR file
@@ -89,8 +174,6 @@ def read_wavecar(wavecar_path: str = "WAVECAR") -> Dict:
         Dictionary containing WAVECAR information
     """
     wavecar_file = Path(wavecar_path)
-    if not wavecar_file.exists():
-        raise FileNotFoundError(f"WAVECAR file not found: {wavecar_file}")
     
     info = {
         'nrecl': 0,
@@ -104,15 +187,30 @@ def read_wavecar(wavecar_path: str = "WAVECAR") -> Dict:
         'energies': []
     }
     
-    # WAVECAR is a binary file, so we need to read it carefully
-    # This is a simplified version - the full implementation would need
-    # to handle the binary format properly
+    # WAVECAR is a direct-access file of float64 records.  Only the two
+    # header records are read; the coefficient blocks, which make up
+    # nearly all of the file, are never touched.
+    import numpy as np
     
     try:
-        with open(wavecar_file, 'rb') as f:
-            # Read header information
-            # This is a placeholder - actual implementation would parse binary data
-            pass
+        with open(wavecar_file, 'rb') as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # Record 1: record length, number of spins, precision tag
+            nrecl, nspin, nprec = (int(x) for x in np.frombuffer(mm[:24], dtype=np.float64))
+            if nrecl < 96:
+                raise ValueError(f"invalid record length {nrecl}")
+            # Record 2: k-points, bands, cutoff and the real-space lattice
+            header = np.frombuffer(mm[nrecl:nrecl + 96], dtype=np.float64)
+            
+            info['nrecl'] = nrecl
+            info['nspin'] = nspin
+            info['nprec'] = nprec
+            info['nkpts'] = int(header[0])
+            info['nbands'] = int(header[1])
+            info['ecut'] = float(header[2])
+            info['lattice_vectors'] = header[3:12].reshape(3, 3)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"WAVECAR file not found: {wavecar_file}") from None
     except Exception as e:
         print(f"Warning: Could not read WAVECAR file: {e}")
     
@@ -121,7 +219,8 @@ def read_wavecar(wavecar_path: str = "WAVECAR") -> Dict:
 
 def validate_input_files(outcar_path: str = "OUTCAR", 
                         wavecar_path: str = "WAVECAR",
-                        work_dir: Optional[str] = None) -> bool:
+                        work_dir: Optional[str] = None,
+                        strict: bool = False) -> bool:
     """
     Validate that required input files exist and are readable
     
@@ -133,6 +232,9 @@ def validate_input_files(outcar_path: str = "OUTCAR",
         Path to WAVECAR file
     work_dir : str, optional
         Working directory
+    strict : bool
+        Also open the files and read their first bytes.  By default only
+        their metadata is checked, which needs no file I/O.
         
     Returns
     -------
@@ -144,28 +246,35 @@ def validate_input_files(outcar_path: str = "OUTCAR",
     outcar_file = base_dir / outcar_path
     wavecar_file = base_dir / wavecar_path
     
-    if not outcar_file.exists():
-        print(f"Error: OUTCAR file not found: {outcar_file}")
-        return False
-    
-    if not wavecar_file.exists():
-        print(f"Error: WAVECAR file not found: {wavecar_file}")
-        return False
-    
-    # Check if files are readable
-    try:
-        with open(outcar_file, 'r') as f:
-            f.read(100)  # Read first 100 characters
-    except Exception as e:
-        print(f"Error: Cannot read OUTCAR file: {e}")
-        return False
-    
-    try:
-        with open(wavecar_file, 'rb') as f:
-            f.read(100)  # Read first 100 bytes
-    except Exception as e:
-        print(f"Error: Cannot read WAVECAR file: {e}")
-        return False
+    for label, path in (("OUTCAR", outcar_file), ("WAVECAR", wavecar_file)):
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            print(f"Error: {label} file not found: {path}")
+            return False
+        except OSError as e:
+            print(f"Error: Cannot read {label} file: {e}")
+            return False
+        
+        if not stat.S_ISREG(st.st_mode):
+            print(f"Error: {label} path is not a file: {path}")
+            return False
+        
+        # Permission bits only; no data is paged in
+        if not os.access(path, os.R_OK):
+            print(f"Error: Cannot read {label} file: permission denied: {path}")
+            return False
+        
+        if strict:
+            if st.st_size == 0:
+                print(f"Error: {label} file is empty: {path}")
+                return False
+            try:
+                with open(path, 'rb') as f:
+                    f.read(100)  # Read first 100 bytes
+            except Exception as e:
+                print(f"Error: Cannot read {label} file: {e}")
+                return False
     
     return True
 
@@ -188,6 +297,9 @@ def get_data_path() -> Path:
     return data_dir
 
 
+_KLG_FILE_RE = re.compile(r'kLG_(\d+)\.data')
+
+
 def list_available_space_groups() -> List[int]:
     """
     List available space group numbers in the kLittleGroups data
@@ -195,24 +307,28 @@ def list_available_space_groups() -> List[int]:
     Returns
     -------
     list
-        List of available space group numbers
+        List of available space group numbers.  The directory is scanned
+        once per process; ``list_available_space_groups.cache_clear()``
+        forces a rescan.
     """
+    return list(_space_group_numbers())
+
+
+@functools.lru_cache(maxsize=1)
+def _space_group_numbers() -> Tuple[int, ...]:
+    """Scan the kLittleGroups directory once; the installed data never changes"""
     data_dir = get_data_path()
     kLittleGroups_dir = data_dir / 'kLittleGroups'
     
-    if not kLittleGroups_dir.exists():
-        return []
-    
-    space_groups = []
-    for file in kLittleGroups_dir.glob('kLG_*.data'):
-        try:
+    try:
+        with os.scandir(kLittleGroups_dir) as entries:
             # Extract space group number from filename
-            sgn = int(file.stem.split('_')[1])
-            space_groups.append(sgn)
-        except (ValueError, IndexError):
-            continue
+            space_groups = [int(m.group(1)) for entry in entries
+                            if (m := _KLG_FILE_RE.fullmatch(entry.name))]
+    except FileNotFoundError:
+        return ()
     
-    return sorted(space_groups)
+    return tuple(sorted(space_groups))
 
 
 def check_space_group_availability(space_group: int) -> bool:
@@ -229,6 +345,20 @@ def check_space_group_availability(space_group: int) -> bool:
     bool
         True if data is available, False otherwise
     """
-    available_sgs = list_available_space_groups()
-    return space_group in available_sgs
+    return space_group in _available_space_group_set()
+
+
+@functools.lru_cache(maxsize=1)
+def _available_space_group_set() -> FrozenSet[int]:
+    """Hashable view of the available space groups for O(1) lookups"""
+    return frozenset(_space_group_numbers())
+
+
+def _clear_space_group_cache() -> None:
+    """Forget the kLittleGroups scan, e.g. after data files were added in a test"""
+    _space_group_numbers.cache_clear()
+    _available_space_group_set.cache_clear()
+
 
+# Same spelling as an lru_cache-decorated function
+list_available_space_groups.cache_clear = _clear_space_group_cache
@@ -18,65 +18,61 @@ import re
 import os
 from pathlib import Path
 
+# 预编译的替换模式
+_CIBW_BUILD_RE = re.compile(r'CIBW_BUILD: \${{ needs\.setup\.outputs\.python-versions-cibw }}')
+# 行首锚定, 以免匹配 before-build = [...]; DOTALL 支持跨行的列表
+_BUILD_RE = re.compile(r'^build = \[.*?\]', re.MULTILINE | re.DOTALL)
+_VERSION_RE = re.compile(r'\d+\.\d+')
+
+def _rewrite_file(path, pattern, replacement, summary):
+    """在同一次打开中读取并按需改写文件, 已是目标内容时不做替换和写入"""
+    try:
+        f = path.open("r+", encoding="utf-8")
+    except FileNotFoundError:
+        print(f"❌ 文件不存在: {path}")
+        return False
+    
+    with f:
+        content = f.read()
+        
+        # 已包含目标配置时跳过正则替换
+        if replacement in content:
+            print(f"ℹ️  {path} 无需更新")
+            return True
+        
+        new_content = pattern.sub(replacement, content)
+        if new_content == content:
+            print(f"ℹ️  {path} 无需更新")
+            return True
+        
+        f.seek(0)
+        f.write(new_content)
+        f.truncate()
+    
+    print(f"✅ 已更新 {path}: {summary}")
+    return True
+
 def update_workflow_yml(python_versions):
     """更新GitHub Actions工作流中的Python版本配置"""
     workflow_path = Path(".github/workflows/build.yml")
     
-    if not workflow_path.exists():
-        print(f"❌ 文件不存在: {workflow_path}")
-        return False
-    
     # 生成cibuildwheel格式: "cp39-* cp310-* cp311-*"
-    version_numbers = [v.replace(".", "") for v in python_versions]
-    cibw_versions = [f"cp{v}-*" for v in version_numbers]
-    cibw_format = " ".join(cibw_versions)
-    
-    # 读取文件
-    content = workflow_path.read_text()
-    
-    # 替换CIBW_BUILD配置
-    pattern = r'CIBW_BUILD: \${{ needs\.setup\.outputs\.python-versions-cibw }}'
+    cibw_format = " ".join(f"cp{v.replace('.', '')}-*" for v in python_versions)
     replacement = f'CIBW_BUILD: "{cibw_format}"'
     
-    new_content = re.sub(pattern, replacement, content)
-    
-    if new_content != content:
-        workflow_path.write_text(new_content)
-        print(f"✅ 已更新 {workflow_path}: {cibw_format}")
-        return True
-    else:
-        print(f"ℹ️  {workflow_path} 无需更新")
-        return True
+    # 替换CIBW_BUILD配置
+    return _rewrite_file(workflow_path, _CIBW_BUILD_RE, replacement, cibw_format)
 
 def update_pyproject_toml(python_versions):
     """更新pyproject.toml中的构建版本"""
     pyproject_path = Path("pyproject.toml")
     
-    if not pyproject_path.exists():
-        print(f"❌ 文件不存在: {pyproject_path}")
-        return False
-    
     # 生成pyproject格式: ["cp39-*", "cp310-*", "cp311-*"]
-    version_numbers = [v.replace(".", "") for v in python_versions]
-    cibw_versions = [f'"cp{v}-*"' for v in version_numbers]
-    pyproject_format = f'[{", ".join(cibw_versions)}]'
-    
-    # 读取文件
-    content = pyproject_path.read_text()
-    
-    # 替换build配置
-    pattern = r'build = \[.*?\]'
+    pyproject_format = "[" + ", ".join(f'"cp{v.replace(".", "")}-*"' for v in python_versions) + "]"
     replacement = f'build = {pyproject_format}'
     
-    new_content = re.sub(pattern, replacement, content)
-    
-    if new_content != content:
-        pyproject_path.write_text(new_content)
-        print(f"✅ 已更新 {pyproject_path}: {pyproject_format}")
-        return True
-    else:
-        print(f"ℹ️  {pyproject_path} 无需更新")
-        return True
+    # 替换build配置
+    return _rewrite_file(pyproject_path, _BUILD_RE, replacement, pyproject_format)
 
 def main():
     if len(sys.argv) != 2:
@@ -90,7 +86,7 @@ def main():
     
     # 验证版本格式
     for version in python_versions:
-        if not re.match(r'^\d+\.\d+$', version):
+        if not _VERSION_RE.fullmatch(version):
             print(f"❌ 无效的Python版本格式: {version}")
             sys.exit(1)
     
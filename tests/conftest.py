@@ -0,0 +1,31 @@
+"""
+Shared fixtures: a stand-in for the Fortran executable
+"""
+
+import os
+import stat
+
+import pytest
+
+
+@pytest.fixture
+def make_irssg(tmp_path):
+    """Return a factory writing a ``#!/bin/sh`` script with the given body"""
+    def make(body: str, name: str = "irssg") -> str:
+        path = tmp_path / "bin" / name
+        path.parent.mkdir(exist_ok=True)
+        path.write_text("#!/bin/sh\n" + body)
+        path.chmod(path.stat().st_mode | stat.S_IXUSR)
+        return os.fspath(path)
+    
+    return make
+
+
+@pytest.fixture
+def work_dir(tmp_path):
+    """A calculation directory holding the inputs the wrapper looks for"""
+    path = tmp_path / "calc"
+    path.mkdir()
+    for name in ("irssg.in", "OUTCAR", "WAVECAR"):
+        (path / name).write_text("")
+    return path
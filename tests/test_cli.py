@@ -0,0 +1,78 @@
+"""
+Tests for the command line interface
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import irssg
+from irssg.cli import main
+
+CLI_SCRIPT = Path(__file__).resolve().parent.parent / "python" / "irssg" / "cli.py"
+
+
+def test_cli_runs_as_script(tmp_path):
+    # Started from elsewhere, so only the script's own path fix-up can
+    # make the package importable
+    result = subprocess.run([sys.executable, str(CLI_SCRIPT), "--version"],
+                            cwd=tmp_path, capture_output=True, text=True)
+    
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == f"IRSSG Python Interface v{irssg.__version__}"
+
+
+def test_cli_runs_executable(make_irssg, work_dir, capfd):
+    exe = make_irssg('echo "args $*"\npwd\nexit 2\n')
+    
+    assert main(["--irssg-path", exe, "-w", str(work_dir), "-k", "1", "3", "-b", "2", "4"]) == 2
+    assert capfd.readouterr().out == f"args -nk 1 3 -nb 2 4\n{work_dir}\n"
+
+
+def test_cli_output_file(make_irssg, work_dir, tmp_path):
+    exe = make_irssg('echo "args $*"\n')
+    output = tmp_path / "irssg.log"
+    
+    assert main(["--irssg-path", exe, "-w", str(work_dir), "-o", str(output)]) == 0
+    assert output.read_text() == "args \n"
+
+
+@pytest.mark.parametrize("argv, message", [
+    (["-k", "3", "1"], "Error: invalid k-point range 3-1"),
+    (["-b", "0", "2"], "Error: invalid band range 0-2"),
+    (["-w", "does-not-exist"], "Error: Work directory 'does-not-exist' not found"),
+])
+def test_cli_rejects_arguments(make_irssg, tmp_path, capsys, monkeypatch, argv, message):
+    exe = make_irssg(f"touch {tmp_path}/started\n")
+    monkeypatch.chdir(tmp_path)
+    
+    assert main(["--irssg-path", exe] + argv) == 1
+    assert capsys.readouterr().out.strip() == message
+    assert not (tmp_path / "started").exists()
+
+
+def test_cli_irssg_path_not_executable(tmp_path, capsys):
+    exe = tmp_path / "irssg"
+    exe.write_text("")
+    
+    assert main(["--irssg-path", str(exe)]) == 1
+    assert "not found or not executable" in capsys.readouterr().out
+
+
+def test_cli_output_file_cannot_be_opened(make_irssg, tmp_path, capsys):
+    exe = make_irssg("")
+    
+    assert main(["--irssg-path", exe, "-o", str(tmp_path / "missing" / "out")]) == 1
+    assert capsys.readouterr().out.startswith("Error writing to output file:")
+
+
+def test_cli_timeout_keeps_output(make_irssg, work_dir, tmp_path, capsys):
+    exe = make_irssg('echo started\nexec sleep 10\n')
+    output = tmp_path / "irssg.log"
+    
+    assert main(["--irssg-path", exe, "-w", str(work_dir), "-o", str(output),
+                 "--timeout", "0.5"]) == 1
+    assert capsys.readouterr().out == "Error: IRSSG did not finish within 0.5 seconds\n"
+    assert output.read_text() == "started\n"
@@ -0,0 +1,214 @@
+"""
+Tests for the subprocess wrapper, using a shell script as the executable
+"""
+
+import os
+import subprocess
+
+import pytest
+
+from irssg.core import (IRSSG, _check_range, _irssg_argv, _link_inputs, _missing_inputs,
+                        _split_range)
+
+# Prints its arguments and working directory; the chunk that does not
+# start at k-point 1 outlives any short timeout.  exec keeps the pipes
+# from being held open by a grandchild after the script is killed.
+SLOW_CHUNK = """\
+echo "args $*"
+echo "cwd $(pwd)"
+case "$2" in 1) ;; *) exec sleep 10 ;; esac
+"""
+
+
+@pytest.mark.parametrize("start, end, nproc, chunks", [
+    (1, 10, 3, [(1, 4), (5, 7), (8, 10)]),
+    (3, 4, 8, [(3, 3), (4, 4)]),
+    (5, 5, 2, [(5, 5)]),
+    (1, 6, 0, [(1, 6)]),
+])
+def test_split_range(start, end, nproc, chunks):
+    assert _split_range(start, end, nproc) == chunks
+
+
+def test_irssg_argv():
+    assert _irssg_argv("/bin/irssg", None, None) == ["/bin/irssg"]
+    assert _irssg_argv("/bin/irssg", (1, 4), (10, 20)) == [
+        "/bin/irssg", "-nk", "1", "4", "-nb", "10", "20"
+    ]
+
+
+@pytest.mark.parametrize("selection", [(0, 3), (4, 3), (-1, 2)])
+def test_check_range_rejects(selection):
+    with pytest.raises(ValueError, match="invalid band range"):
+        _check_range("band", selection)
+
+
+def test_check_range_accepts():
+    _check_range("k-point", None)
+    _check_range("k-point", (2, 2))
+
+
+def test_link_inputs(work_dir, tmp_path):
+    (work_dir / "kLittleGroups").mkdir()
+    (work_dir / "WAVECAR").write_text("coefficients")
+    (work_dir / "unrelated.txt").write_text("")
+    shard_dir = tmp_path / "shard"
+    shard_dir.mkdir()
+    
+    _link_inputs(os.fspath(work_dir), os.fspath(shard_dir))
+    
+    assert sorted(os.listdir(shard_dir)) == ["OUTCAR", "WAVECAR", "irssg.in", "kLittleGroups"]
+    assert (shard_dir / "WAVECAR").read_text() == "coefficients"
+    assert (shard_dir / "kLittleGroups").is_dir()
+
+
+def test_validate_input_rechecks_missing_files(work_dir, capsys):
+    irssg = IRSSG.from_resolved("/bin/true")
+    st = os.stat(work_dir)
+    (work_dir / "WAVECAR").unlink()
+    os.utime(work_dir, ns=(st.st_atime_ns, st.st_mtime_ns))
+    
+    assert not irssg.validate_input(work_dir)
+    assert "WAVECAR not found" in capsys.readouterr().out
+    
+    # Recreated within the same mtime tick: the cached answer is not trusted
+    (work_dir / "WAVECAR").write_text("")
+    os.utime(work_dir, ns=(st.st_atime_ns, st.st_mtime_ns))
+    assert irssg.validate_input(work_dir)
+
+
+def test_validate_input_cache_clear(work_dir):
+    irssg = IRSSG.from_resolved("/bin/true")
+    st = os.stat(work_dir)
+    assert irssg.validate_input(work_dir)
+    assert _missing_inputs.cache_info().currsize > 0
+    
+    # A removal that leaves the mtime unchanged is only seen after clearing
+    (work_dir / "OUTCAR").unlink()
+    os.utime(work_dir, ns=(st.st_atime_ns, st.st_mtime_ns))
+    assert irssg.validate_input(work_dir)
+    
+    IRSSG.validate_input.cache_clear()
+    assert _missing_inputs.cache_info().currsize == 0
+    assert not irssg.validate_input(work_dir)
+
+
+def test_validate_input_missing_directory(tmp_path):
+    assert not IRSSG.from_resolved("/bin/true").validate_input(tmp_path / "missing")
+
+
+def test_run_passes_ranges_and_work_dir(make_irssg, work_dir):
+    irssg = IRSSG.from_resolved(make_irssg('echo "args $*"\npwd\n'))
+    
+    result = irssg.run(work_dir, k_range=(2, 3), band_range=(1, 5))
+    
+    assert result.returncode == 0
+    assert result.stdout == f"args -nk 2 3 -nb 1 5\n{work_dir}\n"
+
+
+def test_run_rejects_bad_range_before_starting(make_irssg, work_dir, tmp_path):
+    irssg = IRSSG.from_resolved(make_irssg(f"touch {tmp_path}/started\n"))
+    
+    with pytest.raises(ValueError):
+        irssg.run(work_dir, k_range=(3, 1))
+    assert not (tmp_path / "started").exists()
+
+
+def test_sharded_run_reads_num_k_from_outcar(make_irssg, work_dir):
+    (work_dir / "OUTCAR").write_text(
+        "   k-points           NKPTS =      4   k-points in BZ     NKDIM =      4"
+        "   number of bands    NBANDS=      8\n"
+    )
+    irssg = IRSSG.from_resolved(make_irssg('echo "args $*"\n'))
+    
+    result = irssg.run(work_dir, nproc=2)
+    
+    assert result.stdout == "args -nk 1 2\nargs -nk 3 4\n"
+
+
+def test_sharded_run_uses_linked_inputs(make_irssg, work_dir):
+    (work_dir / "irssg.in").write_text("input\n")
+    irssg = IRSSG.from_resolved(make_irssg("cat irssg.in\n"))
+    
+    result = irssg.run(work_dir, k_range=(1, 3), nproc=3)
+    
+    assert result.stdout == "input\ninput\ninput\n"
+
+
+def test_sharded_run_merges_chunks(make_irssg, work_dir):
+    irssg = IRSSG.from_resolved(make_irssg('echo "args $*"\necho "err $2" >&2\n'))
+    
+    result = irssg.run(work_dir, k_range=(1, 5), nproc=2)
+    
+    assert result.returncode == 0
+    assert result.stdout == "args -nk 1 3\nargs -nk 4 5\n"
+    assert result.stderr == "err 1\nerr 4\n"
+    assert [chunk.args[1:] for chunk in result.chunks] == [["-nk", "1", "3"], ["-nk", "4", "5"]]
+    assert result.args == [chunk.args for chunk in result.chunks]
+
+
+def test_sharded_run_output_file(make_irssg, work_dir, tmp_path):
+    irssg = IRSSG.from_resolved(make_irssg('echo "args $*"\n'))
+    output_file = tmp_path / "out.txt"
+    
+    result = irssg.run(work_dir, k_range=(1, 3), band_range=(2, 4), nproc=3,
+                       output_file=output_file)
+    
+    assert result.stdout is None
+    assert output_file.read_text() == (
+        "args -nk 1 1 -nb 2 4\nargs -nk 2 2 -nb 2 4\nargs -nk 3 3 -nb 2 4\n"
+    )
+
+
+def test_sharded_run_returncode(make_irssg, work_dir):
+    irssg = IRSSG.from_resolved(make_irssg('[ "$2" = 1 ] || exit 3\n'))
+    
+    assert irssg.run(work_dir, k_range=(1, 2), nproc=2).returncode == 3
+
+
+def test_sharded_timeout_keeps_output_file(make_irssg, work_dir, tmp_path):
+    irssg = IRSSG.from_resolved(make_irssg(SLOW_CHUNK))
+    output_file = tmp_path / "out.txt"
+    
+    with pytest.raises(subprocess.TimeoutExpired):
+        irssg.run(work_dir, timeout=1, k_range=(1, 2), nproc=2, output_file=output_file)
+    
+    lines = output_file.read_text().splitlines()
+    assert lines[0] == "args -nk 1 1"
+    assert lines[1] == f"cwd {work_dir}"
+    assert lines[2] == "args -nk 2 2"
+
+
+def test_sharded_timeout_carries_chunk_output(make_irssg, work_dir):
+    irssg = IRSSG.from_resolved(make_irssg(SLOW_CHUNK))
+    
+    with pytest.raises(subprocess.TimeoutExpired) as excinfo:
+        irssg.run(work_dir, timeout=1, k_range=(1, 2), nproc=2)
+    
+    assert excinfo.value.stdout.startswith(b"args -nk 2 2\n")
+
+
+def test_serial_timeout_keeps_output_file(make_irssg, work_dir, tmp_path):
+    irssg = IRSSG.from_resolved(make_irssg(SLOW_CHUNK))
+    output_file = tmp_path / "out.txt"
+    
+    with pytest.raises(subprocess.TimeoutExpired):
+        irssg.run(work_dir, timeout=1, k_range=(2, 2), output_file=output_file)
+    
+    assert output_file.read_text().startswith("args -nk 2 2\n")
+
+
+def test_run_result_kpoint_headers(make_irssg, work_dir, tmp_path):
+    irssg = IRSSG.from_resolved(make_irssg(
+        'echo "knum =    $2 spin = up"\n'
+        'echo "K =  0.000000 0.500000 0.000000 kname = M"\n'
+    ))
+    
+    headers, names = irssg.run(work_dir, k_range=(1, 2), nproc=2).kpoint_headers()
+    
+    assert list(headers['k_point']) == [1, 2]
+    assert list(names) == ['M', 'M']
+    
+    result = irssg.run(work_dir, output_file=tmp_path / "out.txt")
+    with pytest.raises(ValueError):
+        result.kpoint_headers()
@@ -0,0 +1,86 @@
+"""
+Regression tests for the OUTCAR, WAVECAR and output parsers
+"""
+
+from pathlib import Path
+
+import numpy as np
+
+from irssg._outcar_parse import parse_outcar
+from irssg.utils import parse_kpoint_headers, read_vasp_output, read_wavecar
+
+EXAMPLE_DIR = Path(__file__).resolve().parent.parent / "examples" / "test_irssg"
+
+EXAMPLE_LATTICE = np.array([
+    [4.1029999, 0.0, 0.0],
+    [-2.05149995, 3.553302145, 0.0],
+    [0.0, 0.0, 5.463],
+])
+
+LATTICE_BLOCK = """\
+  direct lattice vectors                    reciprocal lattice vectors
+     4.102999900  0.000000000  0.000000000     0.243724110  0.140714181  0.000000000
+    -2.051499950  3.553302145  0.000000000     0.000000000  0.281428361  0.000000000
+     0.000000000  0.000000000  5.463000000     0.000000000  0.000000000  0.183049606
+"""
+
+HEADER = """\
+ SYSTEM =  test system
+   k-points           NKPTS =      6   k-points in BZ     NKDIM =      6   number of bands    NBANDS=     15
+   ISPIN  =      2    spin polarized calculation?
+"""
+
+
+def test_parse_example_outcar():
+    info = read_vasp_output(EXAMPLE_DIR / "OUTCAR")
+    
+    assert info['num_k'] == 6
+    assert info['num_bands'] == 15
+    assert info['nspin'] == 2
+    assert np.allclose(info['lattice_vectors'], EXAMPLE_LATTICE)
+
+
+def test_truncated_last_lattice_block(tmp_path):
+    # VASP is still writing the last ionic step: the earlier block is used
+    outcar = tmp_path / "OUTCAR"
+    outcar.write_text(HEADER + LATTICE_BLOCK.replace("5.463", "6.000")
+                      + "".join(LATTICE_BLOCK.splitlines(keepends=True)[:2]))
+    
+    info = parse_outcar(outcar)
+    
+    assert info['num_k'] == 6
+    assert info['title'] == "test system"
+    assert np.allclose(info['lattice_vectors'][2], [0.0, 0.0, 6.0])
+
+
+def test_only_lattice_block_truncated(tmp_path):
+    outcar = tmp_path / "OUTCAR"
+    outcar.write_text(HEADER + LATTICE_BLOCK[:LATTICE_BLOCK.index("-2.05")])
+    
+    assert parse_outcar(outcar)['lattice_vectors'] is None
+
+
+def test_read_example_wavecar():
+    info = read_wavecar(EXAMPLE_DIR / "WAVECAR")
+    
+    assert info['nkpts'] == 6
+    assert info['nbands'] == 15
+    assert info['nspin'] == 2
+    assert info['ecut'] == 520.0
+
+
+def test_parse_kpoint_headers():
+    output = (
+        "knum =    1 spin = up\n"
+        "K =  0.000000 0.000000-0.500000 kname = A\n"
+        "knum =    2\n"
+        "K =  0.500000 0.000000 0.000000\n"
+        "kname = M\n"
+    )
+    
+    headers, names = parse_kpoint_headers(output)
+    
+    assert list(headers['k_point']) == [1, 2]
+    assert list(headers['spin']) == ['up', '']
+    assert np.allclose(headers['k_coords'], [[0.0, 0.0, -0.5], [0.5, 0.0, 0.0]])
+    assert list(names) == ['A', 'M']